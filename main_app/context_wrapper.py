@@ -1,7 +1,8 @@
+from __future__ import annotations
 from abc import ABC, abstractmethod
 from functools import cached_property
 from shared_python.shared_math.geometry import Rect, Vec2, BezierPathA, BezierContour, BezierPath, BezierPoint
-from typing import overload
+from typing import Callable, overload
 from skia import *
 import skia
 
@@ -39,6 +40,13 @@ class ContextPath(ABC):
     def fill_color(self, color) -> None:
         self._fill = color
 
+    @property
+    def style(self) -> tuple:
+        """
+        The paint state used to draw this path, paths with an equal style can be batched
+        """
+        return (self._stroke, self._fill, self._stroke_thickness)
+
     def set_path(self, path: BezierPathA) -> None:
         self._path = path
         if self.path:
@@ -48,6 +56,15 @@ class ContextPath(ABC):
     def translate(self, pos: Vec2) -> None:
         pass
 
+    @abstractmethod
+    def offset(self, dx: float, dy: float) -> None:
+        pass
+
+    @property
+    @abstractmethod
+    def bounds(self) -> tuple[float, float, float, float]:
+        pass
+
     @abstractmethod
     @cached_property
     def path(self):
@@ -91,15 +108,53 @@ class ContextPathSkia(ContextPath):
         return ret
 
     def translate(self, pos: Vec2) -> None:
+        self.offset(pos.x, pos.y)
+
+    def offset(self, dx: float, dy: float) -> None:
         if self.path:
             for this_path in self.path:
-                this_path.offset(pos.x, pos.y)
+                this_path.offset(dx, dy)
+
+    @property
+    def bounds(self) -> tuple[float, float, float, float]:
+        rect = skia.Rect.MakeEmpty()
+        for this_path in self.path:
+            rect.join(this_path.getBounds())
+
+        return (rect.left(), rect.top(), rect.right(), rect.bottom())
+
+
+class ContextPathBatchSkia(ContextPathSkia):
+    """
+    Merges several paths sharing the same style into a single skia path,
+    so the whole batch is drawn with one call per fill/stroke
+    """
+
+    def __init__(self, paths: list[ContextPath]) -> None:
+        first = paths[0]
+        super().__init__(None, first.stroke_color,
+                         first.fill_color, first.stroke_thickness)
+
+        self._paths = paths
+
+    @cached_property
+    def path(self):
+        merged = skia.Path()
+        for context_path in self._paths:
+            for sk_path in context_path.path:
+                merged.addPath(sk_path)
+
+        return [merged]
 
 
 def path_provider() -> ContextPath:
     return ContextPathSkia
 
 
+def batch_provider() -> ContextPath:
+    return ContextPathBatchSkia
+
+
 class ContextWrapper(ABC):
     def get_context_path(self) -> ContextPath:
         return ContextPath
@@ -124,8 +179,24 @@ class ContextWrapper(ABC):
     def draw_path(self, path: BezierPathA) -> None:
         pass
 
+    @abstractmethod
+    def record(self, x: float, y: float, width: float, height: float,
+               draw: Callable[[ContextWrapper], None]):
+        """
+        Record everything draw() issues into a picture that can be replayed with draw_picture
+        """
+        pass
+
+    @abstractmethod
+    def draw_picture(self, picture) -> None:
+        pass
+
 
 class ContextWrapperSkia(ContextWrapper):
+    # Paints keyed on (argb, style, stroke width), shared by every wrapper so
+    # paths with the same style reuse one immutable paint
+    _paint_cache: dict[tuple[int, int, float], skia.Paint] = {}
+
     def __init__(self, surface):
         self.surface = surface
         self.paint = skia.Paint()
@@ -134,11 +205,22 @@ class ContextWrapperSkia(ContextWrapper):
     def get_context_path(self) -> ContextPathSkia:
         return ContextPathSkia
 
-    def set_color(self, color) -> None:
-        if not isinstance(color, int):
-            color = Color(color.r, color.g, color.b)
+    @staticmethod
+    def _argb(color) -> int:
+        return color if isinstance(color, int) else color.argb
+
+    def _cached_paint(self, color, style, stroke_width: float = 0.0) -> skia.Paint:
+        key = (self._argb(color), int(style), stroke_width)
+        paint = self._paint_cache.get(key)
+        if paint is None:
+            paint = skia.Paint(Color=key[0], Style=style,
+                               StrokeWidth=stroke_width, AntiAlias=True)
+            self._paint_cache[key] = paint
 
-        self.paint.setColor(color)
+        return paint
+
+    def set_color(self, color) -> None:
+        self.paint.setColor(self._argb(color))
 
     def draw_circle(self, center: Vec2, radius: float) -> None:
         self.surface.drawCircle(
@@ -160,14 +242,31 @@ class ContextWrapperSkia(ContextWrapper):
         self.surface.drawRect(rect, self.paint)
 
     def draw_path(self, path: ContextPathSkia) -> None:
+        fill_paint = None
+        if path.fill_color:
+            fill_paint = self._cached_paint(
+                path.fill_color, skia.Paint.kFill_Style)
+
+        stroke_paint = None
+        if path.stroke_color:
+            stroke_paint = self._cached_paint(
+                path.stroke_color, skia.Paint.kStroke_Style, path.stroke_thickness)
+
         for sk_path in path.path:
-            if path.fill_color:
-                self.paint.setStyle(self.paint.kFill_Style)
-                self.set_color(path.fill_color)
-                self.surface.drawPath(sk_path, self.paint)
-
-            if path.stroke_color:
-                self.paint.setStyle(self.paint.kStroke_Style)
-                self.paint.setStrokeWidth(path.stroke_thickness)
-                self.set_color(path.stroke_color)
-                self.surface.drawPath(sk_path, self.paint)
+            if fill_paint is not None:
+                self.surface.drawPath(sk_path, fill_paint)
+
+            if stroke_paint is not None:
+                self.surface.drawPath(sk_path, stroke_paint)
+
+    def record(self, x: float, y: float, width: float, height: float,
+               draw: Callable[[ContextWrapper], None]) -> skia.Picture:
+        recorder = skia.PictureRecorder()
+        canvas = recorder.beginRecording(
+            skia.Rect.MakeXYWH(x, y, width, height))
+        draw(ContextWrapperSkia(canvas))
+
+        return recorder.finishRecordingAsPicture()
+
+    def draw_picture(self, picture: skia.Picture) -> None:
+        self.surface.drawPicture(picture)
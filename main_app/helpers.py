@@ -1,11 +1,11 @@
-from enum import Enum, auto
+from enum import IntEnum, auto
 
 
-class MOUSE_ACTION(Enum):
-    LEFT_CLICK_DOWN = auto(),
-    LEFT_CLICK_DRAG = auto(),
-    LEFT_CLICK_UP = auto(),
-    RIGHT_CLICK_DOWN = auto(),
+class MOUSE_ACTION(IntEnum):
+    LEFT_CLICK_DOWN = auto()
+    LEFT_CLICK_DRAG = auto()
+    LEFT_CLICK_UP = auto()
+    RIGHT_CLICK_DOWN = auto()
 
 
 class Color():
@@ -13,3 +13,19 @@ class Color():
         self.r = r
         self.g = g
         self.b = b
+
+    @property
+    def argb(self) -> int:
+        """
+        Opaque color packed as 0xAARRGGBB, the integer form skia uses for colors
+        """
+        return 0xFF000000 | (self.r << 16) | (self.g << 8) | self.b
+
+    def __eq__(self, other) -> bool:
+        if not isinstance(other, Color):
+            return NotImplemented
+
+        return (self.r, self.g, self.b) == (other.r, other.g, other.b)
+
+    def __hash__(self) -> int:
+        return hash((self.r, self.g, self.b))
@@ -1,18 +1,38 @@
 from shared_python.shared_math.geometry import Vec2
-from ...context_wrapper import ContextWrapper
+from ...context_wrapper import ContextWrapper, ContextPath, batch_provider
 from ...helpers import MOUSE_ACTION
 from .shapes.shapes import Shape
+from .spatial_index import SpatialIndex
+
+
+def _stroked_bounds(bounds: tuple[float, float, float, float], stroke_thickness: float) -> tuple[float, float, float, float]:
+    # Path bounds exclude the stroke, which reaches past the outline
+    minx, miny, maxx, maxy = bounds
+    return (minx - stroke_thickness, miny - stroke_thickness,
+            maxx + stroke_thickness, maxy + stroke_thickness)
+
+
+def _intersects(a: tuple[float, float, float, float], b: tuple[float, float, float, float]) -> bool:
+    return a[0] <= b[2] and b[0] <= a[2] and a[1] <= b[3] and b[1] <= a[3]
+
+
+def _union(a: tuple[float, float, float, float], b: tuple[float, float, float, float]) -> tuple[float, float, float, float]:
+    return (min(a[0], b[0]), min(a[1], b[1]), max(a[2], b[2]), max(a[3], b[3]))
 
 
 class draggable():
     def __init__(self, start_pos: Vec2, dragging_shape: Shape) -> None:
-        self.current_pos = start_pos
+        # Scalars rather than a Vec2 so a drag step allocates no vectors
+        self.cx = start_pos.x
+        self.cy = start_pos.y
         self.shape = dragging_shape
 
     def work(self, pos: Vec2):
-        distance = pos - self.current_pos
-        self.current_pos = pos
-        self.shape.translate(distance)
+        dx = pos.x - self.cx
+        dy = pos.y - self.cy
+        self.cx = pos.x
+        self.cy = pos.y
+        self.shape.translate_xy(dx, dy)
 
 
 class Scene:
@@ -20,35 +40,113 @@ class Scene:
         self.shapes = []
         self.draggable = None
         self.selected = None
+        self.index = SpatialIndex()
+        self._batches = None
+        self._dispatch = {
+            MOUSE_ACTION.LEFT_CLICK_DOWN: self._on_left_click_down,
+            MOUSE_ACTION.LEFT_CLICK_DRAG: self._on_left_click_drag,
+            MOUSE_ACTION.LEFT_CLICK_UP: self._on_left_click_up,
+        }
 
     def add_shape(self, shape):
         self.shapes.append(shape)
+        self.index.insert(shape, shape.bounds())
+        self._batches = None
 
     def remove_shape(self, shape):
         self.shapes.remove(shape)
+        self.index.remove(shape)
+        self._batches = None
 
     def draw(self, context: ContextWrapper):
+        # Batches keep their merged path between frames, so an unchanged
+        # scene is drawn without re-merging any paths
+        if self._batches is None:
+            self._batches = self._build_batches()
+
+        draw_path = context.draw_path
+        for item in self._batches:
+            if isinstance(item, ContextPath):
+                draw_path(item)
+            else:
+                item.draw(context)
+
+    def _build_batches(self) -> list:
+        """
+        Consecutive shapes sharing the same style are merged into one path.
+        A merged path is filled then stroked as a whole, so a run is split as
+        soon as a shape overlaps it, keeping overlapping shapes drawn in order
+        """
+        batches = []
+        run = []
+        run_bounds = None
         for shape in self.shapes:
-            shape.draw(context)
+            context_path = shape.context_path
+            bounds = None
+            if context_path is not None:
+                bounds = _stroked_bounds(
+                    shape.bounds(), context_path.stroke_thickness)
+
+            if run and (context_path is None or
+                        context_path.style != run[0].style or
+                        _intersects(bounds, run_bounds)):
+                batches.append(self._make_batch(run))
+                run = []
+
+            if context_path is None:
+                batches.append(shape)
+            elif run:
+                run.append(context_path)
+                run_bounds = _union(run_bounds, bounds)
+            else:
+                run.append(context_path)
+                run_bounds = bounds
+
+        if run:
+            batches.append(self._make_batch(run))
+
+        return batches
+
+    @staticmethod
+    def _make_batch(run: list[ContextPath]) -> ContextPath:
+        if len(run) == 1:
+            return run[0]
+
+        return batch_provider()(run)
 
     def mouse_action(self, action: MOUSE_ACTION, pos: Vec2) -> bool:
-        match action:
-            case MOUSE_ACTION.LEFT_CLICK_DOWN:
-                if self.selected is None:
-                    for this_shape in self.shapes:
-                        if this_shape.contains(pos):
-                            self.selected = this_shape
-                            return True
-
-            case MOUSE_ACTION.LEFT_CLICK_DRAG:
-                if self.selected is None:
-                    return False
-
-                if self.draggable is None:
-                    self.draggable = draggable(pos, self.selected)
-                else:
-                    self.draggable.work(pos)
-
-            case MOUSE_ACTION.LEFT_CLICK_UP:
-                self.draggable = None
-                self.selected = None
+        handler = self._dispatch.get(action)
+        return handler(pos) if handler else False
+
+    def _on_left_click_down(self, pos: Vec2) -> bool:
+        if self.selected is None:
+            for this_shape in self.index.query(pos.x, pos.y):
+                if this_shape.contains(pos):
+                    self.selected = this_shape
+                    # Anchor at the press, so motion coalesced before the
+                    # first drag flush still moves the shape
+                    self.draggable = draggable(pos, this_shape)
+                    return True
+
+        return False
+
+    def _on_left_click_drag(self, pos: Vec2) -> bool:
+        if self.draggable is None:
+            return False
+
+        self.draggable.work(pos)
+
+        # Moving a shape changes which shapes overlap, so the batches
+        # have to be split again rather than just re-merged
+        self._batches = None
+        return True
+
+    def _on_left_click_up(self, pos: Vec2) -> bool:
+        # The index is only queried on click down, so a dragged
+        # shape only needs re-indexing once it is dropped
+        if self.draggable is not None:
+            self.index.update(self.selected, self.selected.bounds())
+
+        self.draggable = None
+        self.selected = None
+        return False
@@ -1,14 +1,17 @@
 from __future__ import annotations
-import uuid
 import math
+from itertools import count
 from ....context_wrapper import ContextWrapper, path_provider
 from ....helpers import Color
 from shared_python.shared_math.geometry import Vec2, BezierPathA, BezierPath, BezierContour, BezierPoint
 
 
 class Shape:
+    # Ids only need to be unique within a session
+    _next_id = count()
+
     def __init__(self):
-        self.id = uuid.uuid4()
+        self.id = next(Shape._next_id)
         self._path = BezierPathA()
         self.stroke = Color(0, 0, 255)
         self.stroke_thickness = 3.0
@@ -32,10 +35,17 @@ class Shape:
 
         return False
 
+    def bounds(self) -> tuple[float, float, float, float]:
+        return self.context_path.bounds
+
     def translate(self, pos: Vec2):
         self.path.translate(pos)
         self.context_path.translate(pos)
 
+    def translate_xy(self, dx: float, dy: float):
+        self.path.translate(Vec2(dx, dy))
+        self.context_path.offset(dx, dy)
+
     def draw(self, context: ContextWrapper):
         context.set_color(self.color)
         context.draw_path(self.context_path)
@@ -105,6 +115,9 @@ class Shape:
 
 
 class ShapeCircle(Shape):
+    # Drawn directly as a circle, so it is never batched with path shapes
+    context_path = None
+
     def __init__(self, pos: Vec2, radius: float, color: Color):
         super(Shape, self).__init__()
 
@@ -112,14 +125,31 @@ class ShapeCircle(Shape):
         self.radius = radius
         self.color = color
 
+    @property
+    def radius(self) -> float:
+        return self._radius
+
+    @radius.setter
+    def radius(self, radius: float) -> None:
+        self._radius = radius
+        self._r2 = radius * radius
+
     def contains(self, pos: Vec2):
-        distance = ((pos.x - self.pos.x) ** 2 +
-                    (pos.y - self.pos.y) ** 2) ** 0.5
-        return distance <= self.radius
+        dx = pos.x - self.pos.x
+        dy = pos.y - self.pos.y
+        return dx * dx + dy * dy <= self._r2
+
+    def bounds(self) -> tuple[float, float, float, float]:
+        return (self.pos.x - self.radius, self.pos.y - self.radius,
+                self.pos.x + self.radius, self.pos.y + self.radius)
 
     def translate(self, pos: Vec2):
         self.pos.translate(pos)
 
+    def translate_xy(self, dx: float, dy: float):
+        self.pos.x += dx
+        self.pos.y += dy
+
     def draw(self, context: ContextWrapper):
         context.set_color(self.color)
         context.draw_circle(self.pos, self.radius)
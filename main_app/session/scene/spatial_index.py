@@ -0,0 +1,125 @@
+from itertools import count
+from typing import Iterator
+import numpy as np
+from numba import njit
+
+
+# Eager signature so the kernel compiles (or loads from cache) at import,
+# instead of stalling the first click on the UI thread
+@njit("int64(float64[::1], float64[::1], float64[::1], float64[::1], float64, float64, int64)",
+      cache=True)
+def _find_hit(minx, miny, maxx, maxy, x, y, start):
+    for i in range(start, minx.shape[0]):
+        if minx[i] <= x <= maxx[i] and miny[i] <= y <= maxy[i]:
+            return i
+
+    return -1
+
+
+class _Cell:
+    """
+    Bounds of the items in one grid cell as parallel numpy arrays (struct of
+    arrays), kept sorted by insertion order
+    """
+
+    def __init__(self, capacity: int = 8) -> None:
+        # Rows are minx, miny, maxx, maxy
+        self.bounds = np.empty((4, capacity), dtype=np.float64)
+        self.order = np.empty(capacity, dtype=np.int64)
+        self.items = []
+
+    def add(self, item, bounds: tuple[float, float, float, float], order: int) -> None:
+        size = len(self.items)
+        if size == self.order.shape[0]:
+            grown_bounds = np.empty((4, size * 2), dtype=np.float64)
+            grown_bounds[:, :size] = self.bounds
+            grown_order = np.empty(size * 2, dtype=np.int64)
+            grown_order[:size] = self.order
+            self.bounds = grown_bounds
+            self.order = grown_order
+
+        # An updated item keeps its original order, so it may land mid-cell
+        slot = int(np.searchsorted(self.order[:size], order))
+        self.bounds[:, slot + 1:size + 1] = self.bounds[:, slot:size]
+        self.order[slot + 1:size + 1] = self.order[slot:size]
+        self.bounds[:, slot] = bounds
+        self.order[slot] = order
+        self.items.insert(slot, item)
+
+    def remove(self, item) -> None:
+        slot = self.items.index(item)
+        size = len(self.items)
+
+        self.bounds[:, slot:size - 1] = self.bounds[:, slot + 1:size]
+        self.order[slot:size - 1] = self.order[slot + 1:size]
+        del self.items[slot]
+
+
+class SpatialIndex:
+    """
+    Uniform grid bucketing items by their bounding box, so a point query only
+    visits the items in the cell under that point. Each cell stores its bounds
+    as numpy arrays, scanned by a compiled kernel
+    """
+
+    def __init__(self, cell_size: float = 64.0) -> None:
+        self.cell_size = cell_size
+        self._cells: dict[tuple[int, int], _Cell] = {}
+        self._items: dict = {}
+        self._order = count()
+
+    def __len__(self) -> int:
+        return len(self._items)
+
+    def _cells_for(self, bounds: tuple[float, float, float, float]) -> list[tuple[int, int]]:
+        minx, miny, maxx, maxy = bounds
+        size = self.cell_size
+
+        return [(cx, cy)
+                for cx in range(int(minx // size), int(maxx // size) + 1)
+                for cy in range(int(miny // size), int(maxy // size) + 1)]
+
+    def insert(self, item, bounds: tuple[float, float, float, float], order: int = None) -> None:
+        if order is None:
+            order = next(self._order)
+
+        cells = self._cells_for(bounds)
+        self._items[item] = (cells, order)
+        for cell in cells:
+            bucket = self._cells.get(cell)
+            if bucket is None:
+                bucket = self._cells[cell] = _Cell()
+
+            bucket.add(item, bounds, order)
+
+    def remove(self, item) -> None:
+        cells, _ = self._items.pop(item)
+        for cell in cells:
+            bucket = self._cells[cell]
+            bucket.remove(item)
+            if not bucket.items:
+                del self._cells[cell]
+
+    def update(self, item, bounds: tuple[float, float, float, float]) -> None:
+        order = self._items[item][1]
+        self.remove(item)
+        self.insert(item, bounds, order)
+
+    def query(self, x: float, y: float) -> Iterator:
+        """
+        Items whose bounds contain the point, in insertion order.
+        Lazily yielded so callers can stop at the first real hit
+        """
+        size = self.cell_size
+        bucket = self._cells.get((int(x // size), int(y // size)))
+        if bucket is None:
+            return
+
+        minx, miny, maxx, maxy = bucket.bounds[:, :len(bucket.items)]
+
+        x = float(x)
+        y = float(y)
+        i = _find_hit(minx, miny, maxx, maxy, x, y, 0)
+        while i >= 0:
+            yield bucket.items[i]
+            i = _find_hit(minx, miny, maxx, maxy, x, y, i + 1)
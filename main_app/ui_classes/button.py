@@ -2,6 +2,9 @@ from shared_python.shared_math.geometry import Vec2
 from ..context_wrapper import ContextWrapper
 from ..helpers import Color
 
+SELECTED_COLOR = Color(255, 0, 255)
+CLICKED_COLOR = Color(77, 77, 77)
+
 
 class Button:
     def __init__(self, id: str, width: float, height: float, color: Color):
@@ -23,9 +26,9 @@ class Button:
 
     def draw(self, context: ContextWrapper):
         if self.selected:
-            context.set_color(Color(255, 0, 255))
+            context.set_color(SELECTED_COLOR)
         elif self.clicked:
-            context.set_color(Color(77, 77, 77))
+            context.set_color(CLICKED_COLOR)
         else:
             context.set_color(self.color)
 
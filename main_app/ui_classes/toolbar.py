@@ -1,3 +1,4 @@
+import numpy as np
 from shared_python.shared_math.geometry import Vec2
 from ..context_wrapper import ContextWrapper
 from .button import Button
@@ -12,6 +13,8 @@ class Toolbar:
         self.width = width
         self.height = height
         self.margin = 0.0
+        self._picture = None
+        self._picture_state = None
 
         self._create_button_positions()
 
@@ -22,13 +25,29 @@ class Toolbar:
         start_x = self.pos.x  # (self.width - buttons_width) // 2
         y = self.pos.y + ((self.height - buttons_height) // 2)
 
-        for i, btn in enumerate(self.buttons):
-            x = start_x + \
-                sum([self.buttons[j].width for j in range(i)]) + \
-                i * self.margin
+        # Each button starts after the widths of all previous buttons plus a margin each
+        widths = np.array([btn.width for btn in self.buttons], dtype=np.float64)
+        offsets = np.concatenate(([0.0], np.cumsum(widths[:-1])))
+        xs = start_x + offsets + np.arange(len(self.buttons)) * self.margin
+
+        for btn, x in zip(self.buttons, xs.tolist()):
             btn.set_pos(Vec2(x, y))
 
+    def _button_state(self) -> tuple:
+        return tuple((btn.selected, btn.clicked) for btn in self.buttons)
+
     def draw(self, context: ContextWrapper):
+        # The toolbar only changes with its buttons' state, so replay a
+        # recording of it rather than re-issuing every draw call each frame
+        state = self._button_state()
+        if self._picture is None or state != self._picture_state:
+            self._picture = context.record(
+                self.pos.x, self.pos.y, self.width, self.height, self._draw_contents)
+            self._picture_state = state
+
+        context.draw_picture(self._picture)
+
+    def _draw_contents(self, context: ContextWrapper):
         context.set_color(self.bg_color)
         context.draw_rect(self.pos.x, self.pos.y, self.width, self.height)
 
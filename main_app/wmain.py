@@ -12,6 +12,8 @@ from .helpers import MOUSE_ACTION, Color
 from .session.session import Session
 from .session.scene.shapes.shapes import Shape
 
+SHAPE_COLOR = Color(50, 50, 50)
+
 
 class _DrawArea:
     def __init__(self, width, height):
@@ -22,12 +24,18 @@ class _DrawArea:
             Vec2(0, 0), self.width, 32,
             [Button("select", 32, 32, Color(255, 0, 0)),
              Button("delete", 32, 32, Color(0, 255, 0))])
+        self._pending_drag = None
+        self._left_down = False
+        # Set whenever scene or UI state changes, the window only redraws then
+        self.dirty = True
 
     def add_shape(self, shape):
         self.session.add_shape(shape)
+        self.dirty = True
 
     def remove_shape(self, shape):
         self.session.remove_shape(shape)
+        self.dirty = True
 
     def draw(self, context: ContextWrapper):
         self.session.draw(context)
@@ -39,28 +47,41 @@ class _DrawArea:
 
         if button == glfw.MOUSE_BUTTON_LEFT:
             if action == glfw.PRESS:
+                self._left_down = True
                 clicked_button = self.toolbar.hit_test(pos)
                 if clicked_button:
                     clicked_button.click()
+                    self.dirty = True
                 else:
                     self.session.mouse_action(
                         MOUSE_ACTION.LEFT_CLICK_DOWN, pos)
 
             elif action == glfw.RELEASE:
+                self._left_down = False
+                # Land the last queued motion before the drop
+                self.flush_drag()
                 self.session.mouse_action(MOUSE_ACTION.LEFT_CLICK_UP, pos)
 
         if button == glfw.MOUSE_BUTTON_RIGHT:
             if action == glfw.RELEASE:
-                self.session.add_shape(
-                    Shape.construct_polygon(pos + Vec2(60, 60), 40, 7, Color(50, 50, 50)))
+                self.add_shape(
+                    Shape.construct_polygon(pos + Vec2(60, 60), 40, 7, SHAPE_COLOR))
 
-                self.session.add_shape(
-                    Shape.construct_circle(pos, 40, Color(50, 50, 50)))
+                self.add_shape(
+                    Shape.construct_circle(pos, 40, SHAPE_COLOR))
 
     def cursor_pos_callback(self, window, xpos, ypos):
-        if glfw.get_mouse_button(window, glfw.MOUSE_BUTTON_LEFT) == glfw.PRESS:
-            pos = Vec2(xpos, ypos)
-            self.session.mouse_action(MOUSE_ACTION.LEFT_CLICK_DRAG, pos)
+        # Only the latest position matters for a drag, so motion events are
+        # coalesced and applied once per frame by flush_drag
+        if self._left_down:
+            self._pending_drag = (xpos, ypos)
+
+    def flush_drag(self):
+        if self._pending_drag is not None:
+            pos = Vec2(*self._pending_drag)
+            self._pending_drag = None
+            if self.session.mouse_action(MOUSE_ACTION.LEFT_CLICK_DRAG, pos):
+                self.dirty = True
 
 
 class Wmain:
@@ -68,6 +89,18 @@ class Wmain:
         self.width = width
         self.height = height
         self.draw_area = _DrawArea(width, height)
+        self._surface = None
+        self._context_wrapper = None
+        self._fb_size = None
+        self._fb_size_dirty = False
+
+    def _on_resize(self, window, fb_width, fb_height):
+        self._fb_size = (fb_width, fb_height)
+        self._fb_size_dirty = True
+        self.draw_area.dirty = True
+
+    def _on_refresh(self, window):
+        self.draw_area.dirty = True
 
     def run(self):
         with self.glfw_window(self.width, self.height) as window:
@@ -77,23 +110,64 @@ class Wmain:
             glfw.set_cursor_pos_callback(
                 window, self.draw_area.cursor_pos_callback)
 
-            while not glfw.window_should_close(window):
-                GL.glClear(GL.GL_COLOR_BUFFER_BIT)
-
-                with self.skia_surface(window) as surface:
-                    with surface as canvas:
-                        self.draw_area.draw(ContextWrapperSkia(canvas))
-
-                    surface.flushAndSubmit()
-                    glfw.swap_buffers(window)
-
-                glfw.poll_events()
+            glfw.set_framebuffer_size_callback(window, self._on_resize)
+            glfw.set_window_refresh_callback(window, self._on_refresh)
+
+            with self.skia_context() as context:
+                self._fb_size = glfw.get_framebuffer_size(window)
+                self._surface = self.skia_surface(context, *self._fb_size)
+                self._context_wrapper = ContextWrapperSkia(self._surface.getCanvas())
+
+                # Bound once as locals, the loop body is mostly tiny calls
+                # where attribute lookups are a noticeable share of the cost
+                should_close = glfw.window_should_close
+                clear = GL.glClear
+                swap = glfw.swap_buffers
+                wait = glfw.wait_events_timeout
+                draw_area = self.draw_area
+                draw = draw_area.draw
+                flush_drag = draw_area.flush_drag
+                flush = self._surface.flushAndSubmit
+                context_wrapper = self._context_wrapper
+
+                while not should_close(window):
+                    # Only rebuild the render target once a resize was reported
+                    if self._fb_size_dirty:
+                        self._fb_size_dirty = False
+                        self._surface = self.skia_surface(
+                            context, *self._fb_size)
+                        self._context_wrapper = ContextWrapperSkia(
+                            self._surface.getCanvas())
+                        flush = self._surface.flushAndSubmit
+                        context_wrapper = self._context_wrapper
+
+                    # Nothing changed since the last frame, keep showing it
+                    if draw_area.dirty:
+                        draw_area.dirty = False
+
+                        clear(GL.GL_COLOR_BUFFER_BIT)
+
+                        draw(context_wrapper)
+
+                        flush()
+                        swap(window)
+
+                    # Block while idle instead of spinning on poll_events
+                    wait(1 / 60)
+                    flush_drag()
+
+                self._context_wrapper = None
+                self._surface = None
 
     @staticmethod
     @contextlib.contextmanager
-    def skia_surface(window):
+    def skia_context():
         context = GrDirectContext.MakeGL()
-        (fb_width, fb_height) = glfw.get_framebuffer_size(window)
+        yield context
+        context.abandonContext()
+
+    @staticmethod
+    def skia_surface(context: GrDirectContext, fb_width: int, fb_height: int) -> skia.Surface:
         backend_render_target = GrBackendRenderTarget(
             fb_width,
             fb_height,
@@ -104,8 +178,7 @@ class Wmain:
             context, backend_render_target, kBottomLeft_GrSurfaceOrigin,
             kRGBA_8888_ColorType, ColorSpace.MakeSRGB())
         assert surface is not None
-        yield surface
-        context.abandonContext()
+        return surface
 
     @staticmethod
     @contextlib.contextmanager